@@ -1,6 +1,6 @@
 """Application-wide constants and configuration."""
 
-from typing import List
+from typing import FrozenSet, List
 
 # Skill levels
 LEVEL_BEGINNER = 'beginner'
@@ -15,6 +15,10 @@ VALID_LEVELS: List[str] = [
     LEVEL_EXPERT
 ]
 
+# Hashed copy of VALID_LEVELS for membership checks, plus its display form
+VALID_LEVEL_SET: FrozenSet[str] = frozenset(VALID_LEVELS)
+VALID_LEVELS_TEXT = ', '.join(VALID_LEVELS)
+
 # Progress file configuration
 CONFIG_DIR_NAME = '.linuxtutor'
 PROGRESS_FILE_NAME = 'progress.json'
@@ -31,8 +35,11 @@ CHECKBOX_PENDING = '[ ]'
 DEFAULT_LEVEL = LEVEL_BEGINNER
 DEFAULT_FIRST_TIME = True
 
+# Lesson names shorter than this are too ambiguous for near-miss suggestions
+FUZZY_MIN_LENGTH = 4
+
 # Positive responses for yes/no prompts
-AFFIRMATIVE_RESPONSES = ['', 'y', 'yes']
+AFFIRMATIVE_RESPONSES: FrozenSet[str] = frozenset(('', 'y', 'yes'))
 
 # Quiz display symbols
 QUIZ_CHECKMARK = '✓'
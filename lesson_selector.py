@@ -1,12 +1,14 @@
 """Lesson selection and filtering logic."""
 
-from typing import Optional, List, Set, Tuple
+from typing import Optional, List, Sequence, Set, Tuple
+from constants import FUZZY_MIN_LENGTH
 
 
 def get_next_available_lesson(
     lessons_dict: dict,
     current_level: str,
-    completed_lessons: Set[str]
+    completed_lessons: Set[str],
+    level_lessons: Optional[Sequence[str]] = None
 ) -> Optional[str]:
     """
     Find the next uncompleted lesson in current level with all prerequisites met.
@@ -15,18 +17,17 @@ def get_next_available_lesson(
         lessons_dict: Dictionary of all lessons
         current_level: User's current level
         completed_lessons: Set of completed lesson IDs
+        level_lessons: Precomputed sorted lesson IDs for current_level;
+            derived from lessons_dict when omitted
 
     Returns:
         Lesson ID of next available lesson, or None if no lessons available
     """
-    # Get lessons for current level
-    current_level_lessons = [
-        lesson_id for lesson_id, lesson_data in lessons_dict.items()
-        if lesson_data['level'] == current_level
-    ]
-
-    # Sort alphabetically
-    current_level_lessons.sort()
+    # Get lessons for current level, sorted alphabetically
+    if level_lessons is None:
+        current_level_lessons = get_lessons_by_level(lessons_dict, current_level)
+    else:
+        current_level_lessons = level_lessons
 
     # Find first uncompleted lesson where ALL prerequisites are met
     for lesson_id in current_level_lessons:
@@ -84,28 +85,82 @@ def check_prerequisites(
     return len(missing) == 0, missing
 
 
+def _contains_with_gap(head: str, tail: str, text: str) -> bool:
+    """Check whether text contains head, then any one character, then tail."""
+    if not head:
+        return text.find(tail, 1) != -1
+    pos = text.find(head)
+    while pos != -1:
+        if text.startswith(tail, pos + len(head) + 1):
+            return True
+        pos = text.find(head, pos + 1)
+    return False
+
+
+def _contains_within_one_edit(needle: str, text: str) -> bool:
+    """
+    Check whether text contains needle with at most one character typed wrong.
+
+    A wrong character may be an extra one, a missing one or a substituted one.
+
+    Args:
+        needle: Lowercased text to look for
+        text: Lowercased text to look in
+
+    Returns:
+        True if some substring of text is within one edit of needle
+    """
+    for i in range(len(needle) + 1):
+        head = needle[:i]
+        # Every match below starts with head, and longer heads only match less
+        if head not in text:
+            return False
+        # A character left out of needle between head and the rest
+        if _contains_with_gap(head, needle[i:], text):
+            return True
+        if i < len(needle):
+            tail = needle[i + 1:]
+            # An extra character typed at i, or a wrong one
+            if head + tail in text or _contains_with_gap(head, tail, text):
+                return True
+    return False
+
+
 def find_similar_lessons(
     lesson_name: str,
     lessons_dict: dict,
-    max_results: int = 3
+    max_results: int = 3,
+    lesson_ids_lower: Optional[Sequence[str]] = None
 ) -> List[str]:
     """
     Find lessons with similar names.
 
+    Substring matches are preferred; if there are none, IDs that contain
+    the name with one character extra, missing or mistyped are suggested.
+
     Args:
         lesson_name: The lesson name to search for
         lessons_dict: Dictionary of all lessons
         max_results: Maximum number of results to return
+        lesson_ids_lower: Precomputed lowercased IDs in lessons_dict order;
+            derived from lessons_dict when omitted
 
     Returns:
         List of similar lesson IDs
     """
-    similar = []
-    lesson_name_lower = lesson_name.lower()
+    if lesson_ids_lower is None:
+        lesson_ids_lower = [lesson_id.lower() for lesson_id in lessons_dict]
+    needle = lesson_name.lower()
 
-    for lesson_id in lessons_dict.keys():
-        if lesson_name_lower in lesson_id.lower():
-            similar.append(lesson_id)
+    similar = [
+        lesson_id for lesson_id, id_lower in zip(lessons_dict, lesson_ids_lower)
+        if needle in id_lower
+    ]
+    if not similar and len(needle) >= FUZZY_MIN_LENGTH:
+        similar = [
+            lesson_id for lesson_id, id_lower in zip(lessons_dict, lesson_ids_lower)
+            if _contains_within_one_edit(needle, id_lower)
+        ]
 
     return similar[:max_results]
 
@@ -145,7 +200,8 @@ def get_blocked_lessons_info(
 def are_all_lessons_completed(
     lessons_dict: dict,
     current_level: str,
-    completed_lessons: Set[str]
+    completed_lessons: Set[str],
+    level_lessons: Optional[Sequence[str]] = None
 ) -> bool:
     """
     Check if all lessons at current level are completed.
@@ -154,13 +210,16 @@ def are_all_lessons_completed(
         lessons_dict: Dictionary of all lessons
         current_level: User's current level
         completed_lessons: Set of completed lesson IDs
+        level_lessons: Precomputed lesson IDs for current_level;
+            derived from lessons_dict when omitted
 
     Returns:
         True if all lessons at current level are completed
     """
-    level_lessons = [
-        lid for lid, data in lessons_dict.items()
-        if data['level'] == current_level
-    ]
+    if level_lessons is None:
+        level_lessons = [
+            lid for lid, data in lessons_dict.items()
+            if data['level'] == current_level
+        ]
 
     return all(lid in completed_lessons for lid in level_lessons)
@@ -1,9 +1,11 @@
 import os
 import sys
-import subprocess
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from quiz_system import Quiz, QuizRunner
-from ui_prompts import prompt_yes_no
+from ui_prompts import prompt_yes_no, prompt_choice, prompt_press_enter
+from lesson_selector import get_lessons_by_level
+from constants import VALID_LEVELS
 
 LESSONS = {
     'intro-to-terminal': {
@@ -1196,6 +1198,14 @@ Pro tip: Start with nano, learn vim gradually. Many sysadmins know both!'''
     }
 }
 
+# Sorted lesson IDs per level, built once since LESSONS never changes
+LESSONS_BY_LEVEL: Dict[str, Tuple[str, ...]] = {
+    level: tuple(get_lessons_by_level(LESSONS, level)) for level in VALID_LEVELS
+}
+
+# Lowercased lesson IDs in LESSONS order, for lesson-name suggestions
+LESSON_IDS_LOWER: Tuple[str, ...] = tuple(lesson_id.lower() for lesson_id in LESSONS)
+
 def get_lesson(lesson_name: str) -> Optional[Dict[str, Any]]:
     return LESSONS.get(lesson_name)
 
@@ -1223,7 +1233,7 @@ def run_lesson(lesson: Dict[str, Any], tutor) -> None:
 
         if section['type'] == 'explanation':
             print(section['text'])
-            input("\nPress Enter to continue...")
+            prompt_press_enter()
 
         elif section['type'] == 'exercise':
             print(section['text'] if 'text' in section else section['instructions'])
@@ -1233,7 +1243,7 @@ def run_lesson(lesson: Dict[str, Any], tutor) -> None:
                 print(f"Command: {cmd_info['cmd']}")
                 print(f"Purpose: {cmd_info['description']}")
 
-                choice = input("\n[r]un, [s]kip, or [q]uit? ").lower().strip()
+                choice = prompt_choice("\n[r]un, [s]kip, or [q]uit? ", on_eof='q').lower()
 
                 if choice == 'q':
                     print("Lesson interrupted.")
@@ -1251,7 +1261,9 @@ def run_lesson(lesson: Dict[str, Any], tutor) -> None:
 
                         # Handle different commands
                         if cmd in ['whoami', 'pwd', 'date', 'uname']:
-                            # These are safe to run directly
+                            # These are safe to run directly; subprocess is
+                            # imported here so loading lessons stays cheap
+                            import subprocess
                             result = subprocess.run(cmd_info['cmd'], shell=True,
                                                  capture_output=True, text=True)
                             if result.returncode == 0:
@@ -1389,14 +1401,15 @@ def run_lesson(lesson: Dict[str, Any], tutor) -> None:
 
         # Update progress with quiz stats only if completed
         if completed:
-            tutor.progress = tutor.progress_mgr.increment_quiz_stats(tutor.progress, attempts)
-            tutor.save_progress()
-
-            # Mark lesson complete only if quiz was completed
-            if lesson_id:
-                tutor.complete_lesson(lesson_id)
-                tutor.progress['stats']['exercises_completed'] += len([s for s in lesson['content'] if s['type'] == 'exercise'])
+            with tutor.batched_save():
+                tutor.progress_mgr.increment_quiz_stats(tutor.progress, attempts)
                 tutor.save_progress()
+
+                # Mark lesson complete only if quiz was completed
+                if lesson_id:
+                    tutor.complete_lesson(lesson_id)
+                    tutor.progress['stats']['exercises_completed'] += len([s for s in lesson['content'] if s['type'] == 'exercise'])
+                    tutor.save_progress()
         else:
             print("\nQuiz not completed. You can retry this lesson later to complete the quiz.")
             return
@@ -1407,9 +1420,10 @@ def run_lesson(lesson: Dict[str, Any], tutor) -> None:
         print("="*50)
 
         if lesson_id:
-            tutor.complete_lesson(lesson_id)
-            tutor.progress['stats']['exercises_completed'] += len([s for s in lesson['content'] if s['type'] == 'exercise'])
-            tutor.save_progress()
+            with tutor.batched_save():
+                tutor.complete_lesson(lesson_id)
+                tutor.progress['stats']['exercises_completed'] += len([s for s in lesson['content'] if s['type'] == 'exercise'])
+                tutor.save_progress()
 
 def list_all_lessons() -> Dict[str, List[str]]:
     levels = {}
@@ -1422,7 +1436,12 @@ def list_all_lessons() -> Dict[str, List[str]]:
 
 # Search functionality
 
-def _extract_snippet(text: str, keyword: str, context_chars: int = 50) -> str:
+def _extract_snippet(
+    text: str,
+    keyword: str,
+    context_chars: int = 50,
+    text_lower: Optional[str] = None
+) -> str:
     """
     Extract a snippet of text around the keyword for display.
 
@@ -1430,11 +1449,13 @@ def _extract_snippet(text: str, keyword: str, context_chars: int = 50) -> str:
         text: The full text to extract from
         keyword: The keyword to find (case-insensitive)
         context_chars: Number of characters to show before and after keyword
+        text_lower: text.lower(), when the caller already has it
 
     Returns:
         A snippet string with context around the keyword
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     keyword_lower = keyword.lower()
 
     pos = text_lower.find(keyword_lower)
@@ -1456,6 +1477,17 @@ def _extract_snippet(text: str, keyword: str, context_chars: int = 50) -> str:
 
     return snippet
 
+# Relevance weight per matched field; fields not listed weigh 1
+_FIELD_WEIGHTS: Dict[str, int] = {
+    'title': 10,
+    'description': 5,
+    'section_title': 3,
+    'command_desc': 2,
+    'command': 2,
+    'text': 1,
+    'level': 3,
+}
+
 def _calculate_score(matches: Dict[str, int]) -> int:
     """
     Calculate relevance score based on match counts and field weights.
@@ -1466,22 +1498,20 @@ def _calculate_score(matches: Dict[str, int]) -> int:
     Returns:
         Total weighted score
     """
-    weights = {
-        'title': 10,
-        'description': 5,
-        'section_title': 3,
-        'command_desc': 2,
-        'command': 2,
-        'text': 1,
-        'level': 3,
-    }
+    weights = _FIELD_WEIGHTS
+    return sum(count * weights.get(field_type, 1) for field_type, count in matches.items())
 
-    score = 0
-    for field_type, count in matches.items():
-        weight = weights.get(field_type, 1)
-        score += count * weight
+def _normalize_keywords(keywords: List[str]) -> Tuple[str, ...]:
+    """
+    Lowercase keywords, dropping empty terms and repeats in first-seen order.
+
+    Args:
+        keywords: Raw search keywords
 
-    return score
+    Returns:
+        Tuple of distinct, non-empty lowercased keywords
+    """
+    return tuple(dict.fromkeys(k.lower() for k in keywords if k))
 
 def _search_in_lesson(lesson_data: Dict, keywords: List[str]) -> Optional[Dict]:
     """
@@ -1495,9 +1525,27 @@ def _search_in_lesson(lesson_data: Dict, keywords: List[str]) -> Optional[Dict]:
         Match info dict if ALL keywords found, None otherwise.
         Match info contains: matches, score, fields_matched, snippets
     """
+    keywords_lower = _normalize_keywords(keywords)
+    if not keywords_lower:
+        return None
+    return _match_lesson(_search_fields(lesson_data), keywords_lower)
+
+def _match_lesson(
+    fields: Tuple[Tuple[str, str, str, bool], ...],
+    keywords_lower: Tuple[str, ...]
+) -> Optional[Dict]:
+    """
+    Match already-lowercased, distinct keywords against a lesson's search fields.
+
+    Args:
+        fields: The lesson's _search_fields entries
+        keywords_lower: Lowercased keywords without repeats (AND logic)
+
+    Returns:
+        Match info dict as described in _search_in_lesson, or None
+    """
     from collections import defaultdict
 
-    keywords_lower = [k.lower() for k in keywords]
     matches = defaultdict(int)  # field_type -> count
     snippets = {}  # field_type -> snippet text
     fields_matched = set()
@@ -1505,100 +1553,20 @@ def _search_in_lesson(lesson_data: Dict, keywords: List[str]) -> Optional[Dict]:
     # Track which keywords were found anywhere in the lesson
     keywords_found = set()
 
-    # Search lesson title
-    title_lower = lesson_data['title'].lower()
-    for kw in keywords_lower:
-        count = title_lower.count(kw)
-        if count > 0:
-            matches['title'] += count
-            fields_matched.add('title')
-            keywords_found.add(kw)
-
-    # Search lesson description
-    desc_lower = lesson_data['description'].lower()
-    for kw in keywords_lower:
-        count = desc_lower.count(kw)
-        if count > 0:
-            matches['description'] += count
-            fields_matched.add('description')
-            keywords_found.add(kw)
-            # Extract snippet for first keyword match in description
-            if 'description' not in snippets:
-                snippets['description'] = _extract_snippet(lesson_data['description'], kw)
-
-    # Search lesson level
-    level_lower = lesson_data['level'].lower()
-    for kw in keywords_lower:
-        if kw in level_lower:
-            matches['level'] += 1
-            fields_matched.add('level')
-            keywords_found.add(kw)
-
-    # Search content sections
-    for section in lesson_data.get('content', []):
-        # Search section title
-        section_title = section.get('title', '')
-        section_title_lower = section_title.lower()
+    for field_type, text, text_lower, wants_snippet in fields:
         for kw in keywords_lower:
-            count = section_title_lower.count(kw)
+            # The level counts once per keyword rather than per occurrence
+            if field_type == 'level':
+                count = 1 if kw in text_lower else 0
+            else:
+                count = text_lower.count(kw)
             if count > 0:
-                matches['section_title'] += count
-                fields_matched.add('section_title')
+                matches[field_type] += count
+                fields_matched.add(field_type)
                 keywords_found.add(kw)
-                if 'section_title' not in snippets:
-                    snippets['section_title'] = _extract_snippet(section_title, kw)
-
-        # Search explanation text
-        if section.get('type') == 'explanation':
-            text = section.get('text', '')
-            text_lower = text.lower()
-            for kw in keywords_lower:
-                count = text_lower.count(kw)
-                if count > 0:
-                    matches['text'] += count
-                    fields_matched.add('text')
-                    keywords_found.add(kw)
-                    if 'text' not in snippets:
-                        snippets['text'] = _extract_snippet(text, kw)
-
-        # Search exercise instructions
-        if section.get('type') == 'exercise':
-            instructions = section.get('instructions', '')
-            instructions_lower = instructions.lower()
-            for kw in keywords_lower:
-                count = instructions_lower.count(kw)
-                if count > 0:
-                    matches['text'] += count
-                    fields_matched.add('text')
-                    keywords_found.add(kw)
-                    if 'text' not in snippets and instructions:
-                        snippets['text'] = _extract_snippet(instructions, kw)
-
-            # Search commands
-            for cmd_info in section.get('commands', []):
-                # Search command itself
-                cmd = cmd_info.get('cmd', '')
-                cmd_lower = cmd.lower()
-                for kw in keywords_lower:
-                    count = cmd_lower.count(kw)
-                    if count > 0:
-                        matches['command'] += count
-                        fields_matched.add('command')
-                        keywords_found.add(kw)
-                        if 'command' not in snippets:
-                            snippets['command'] = _extract_snippet(cmd, kw)
-
-                # Search command description
-                cmd_desc = cmd_info.get('description', '')
-                cmd_desc_lower = cmd_desc.lower()
-                for kw in keywords_lower:
-                    count = cmd_desc_lower.count(kw)
-                    if count > 0:
-                        matches['command_desc'] += count
-                        fields_matched.add('command_desc')
-                        keywords_found.add(kw)
-                        if 'command_desc' not in snippets:
-                            snippets['command_desc'] = _extract_snippet(cmd_desc, kw)
+                # Snippet from the first keyword match in each field type
+                if wants_snippet and field_type not in snippets:
+                    snippets[field_type] = _extract_snippet(text, kw, text_lower=text_lower)
 
     # Check if ALL keywords were found (AND logic)
     if len(keywords_found) != len(keywords_lower):
@@ -1614,12 +1582,17 @@ def _search_in_lesson(lesson_data: Dict, keywords: List[str]) -> Optional[Dict]:
         'snippets': snippets
     }
 
-def search_lessons(keywords: List[str]) -> List[Dict[str, Any]]:
+def search_lessons(keywords: List[str], level: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Search all lessons for keywords with AND logic and relevance ranking.
 
+    Results are memoized per keyword list and level; each call gets its own
+    copies of the result dicts, so callers may modify them freely.
+
     Args:
-        keywords: List of search terms (case-insensitive, all must match)
+        keywords: List of search terms (case-insensitive, all must match);
+            empty and repeated terms are ignored
+        level: Only search lessons at this level when given
 
     Returns:
         List of match result dicts, sorted by relevance (highest first).
@@ -1630,10 +1603,91 @@ def search_lessons(keywords: List[str]) -> List[Dict[str, Any]]:
         - fields_matched: Set of field types where keywords were found
         - snippets: Dict mapping field types to text snippets
     """
+    keywords = _normalize_keywords(keywords)
+    if not keywords:
+        return []
+    return [
+        {
+            **result,
+            'fields_matched': set(result['fields_matched']),
+            'snippets': dict(result['snippets'])
+        }
+        for result in _search_all_lessons(keywords, level)
+    ]
+
+def _search_fields(lesson_data: Dict[str, Any]) -> Tuple[Tuple[str, str, str, bool], ...]:
+    """
+    Collect the fields _search_in_lesson scans, in scan order.
+
+    Args:
+        lesson_data: The lesson dictionary to index
+
+    Returns:
+        Tuple of (field_type, text, lowercased text, takes_snippet) entries
+    """
+    title = lesson_data['title']
+    description = lesson_data['description']
+    level = lesson_data['level']
+    fields = [
+        ('title', title, title.lower(), False),
+        ('description', description, description.lower(), True),
+        ('level', level, level.lower(), False),
+    ]
+
+    for section in lesson_data.get('content', []):
+        section_title = section.get('title', '')
+        fields.append(('section_title', section_title, section_title.lower(), True))
+
+        # Explanation text and exercise instructions both count as 'text'
+        if section.get('type') == 'explanation':
+            text = section.get('text', '')
+            fields.append(('text', text, text.lower(), True))
+
+        if section.get('type') == 'exercise':
+            instructions = section.get('instructions', '')
+            fields.append(('text', instructions, instructions.lower(), bool(instructions)))
+
+            for cmd_info in section.get('commands', []):
+                cmd = cmd_info.get('cmd', '')
+                fields.append(('command', cmd, cmd.lower(), True))
+                cmd_desc = cmd_info.get('description', '')
+                fields.append(('command_desc', cmd_desc, cmd_desc.lower(), True))
+
+    return tuple(fields)
+
+# Searchable fields of each lesson, lowercased once at import
+_SEARCH_FIELDS: Dict[str, Tuple[Tuple[str, str, str, bool], ...]] = {
+    lesson_id: _search_fields(lesson_data) for lesson_id, lesson_data in LESSONS.items()
+}
+
+# Lowercased text of each lesson; a keyword missing here cannot match the lesson
+_SEARCH_TEXT: Dict[str, str] = {
+    lesson_id: '\0'.join(field[2] for field in fields)
+    for lesson_id, fields in _SEARCH_FIELDS.items()
+}
+
+@lru_cache(maxsize=128)
+def _search_all_lessons(
+    keywords: Tuple[str, ...],
+    level: Optional[str] = None
+) -> Tuple[Dict[str, Any], ...]:
+    """Run an uncached search for already-lowercased keywords, optionally at one level."""
     results = []
 
+    # Probe longer keywords first: they are rarer, so most misses fail on the first check.
+    # Scoring still uses the caller's order, which decides the snippets.
+    probe_order = sorted(keywords, key=len, reverse=True)
+
     for lesson_id, lesson_data in LESSONS.items():
-        match_info = _search_in_lesson(lesson_data, keywords)
+        if level and lesson_data['level'] != level:
+            continue
+
+        # Cheap containment check first; only candidates get the scored scan
+        text = _SEARCH_TEXT[lesson_id]
+        if not all(kw in text for kw in probe_order):
+            continue
+
+        match_info = _match_lesson(_SEARCH_FIELDS[lesson_id], keywords)
         if match_info:
             results.append({
                 'lesson_id': lesson_id,
@@ -1646,4 +1700,4 @@ def search_lessons(keywords: List[str]) -> List[Dict[str, Any]]:
     # Sort by score (highest first)
     results.sort(key=lambda x: x['score'], reverse=True)
 
-    return results
\ No newline at end of file
+    return tuple(results)
@@ -7,15 +7,16 @@ Uses clean separation of concerns with dedicated modules for UI, business logic,
 """
 
 import sys
-import argparse
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 # Core modules
 from progress_manager import ProgressManager
 from lesson_selector import (
     get_next_available_lesson,
-    get_lessons_by_level,
     check_prerequisites,
     find_similar_lessons,
     get_blocked_lessons_info,
@@ -25,6 +26,7 @@ from lesson_selector import (
 # UI modules  
 from ui_display import (
     display_welcome_message,
+    display_welcome_banner,
     display_lesson_list,
     display_lesson_header,
     display_prerequisites_error,
@@ -41,7 +43,8 @@ from ui_display import (
     display_continuing_lesson,
     display_exit_message,
     display_generic_options,
-    display_search_results
+    display_search_results,
+    lesson_display_name
 )
 
 from ui_prompts import (
@@ -54,26 +57,74 @@ from ui_prompts import (
 # Constants
 from constants import (
     VALID_LEVELS,
+    VALID_LEVEL_SET,
+    VALID_LEVELS_TEXT,
     LEVEL_BEGINNER,
     CONFIG_DIR_NAME,
     SEPARATOR_MEDIUM,
     AFFIRMATIVE_RESPONSES
 )
 
+# The home directory cannot change during a run, so resolve it once at import
+_CONFIG_DIR = Path.home() / CONFIG_DIR_NAME
+
 
 class LinuxTutor:
     """Main application class - orchestrates learning experience."""
 
     def __init__(self):
         """Initialize the LinuxTutor application."""
-        self.config_dir = Path.home() / CONFIG_DIR_NAME
+        self.config_dir = _CONFIG_DIR
         self.progress_mgr = ProgressManager(self.config_dir)
-        self.progress = self.progress_mgr.load_progress()
+        self._progress: Optional[Dict[str, Any]] = None
+
+        # Nesting depth of batched_save() blocks and whether a save was deferred
+        self._batch_depth = 0
+        self._dirty = False
+
+    @property
+    def progress(self) -> Dict[str, Any]:
+        """User progress, loaded from disk on first access."""
+        if self._progress is None:
+            self._progress = self.progress_mgr.load_progress()
+        return self._progress
+
+    @progress.setter
+    def progress(self, progress: Dict[str, Any]) -> None:
+        """Replace the in-memory progress."""
+        self._progress = progress
 
     def save_progress(self) -> None:
-        """Save current progress to disk."""
+        """Save current progress to disk (deferred inside batched_save)."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+
         self.progress_mgr.save_progress(self.progress)
 
+    @contextmanager
+    def batched_save(self) -> Iterator[None]:
+        """
+        Coalesce all save_progress calls in the block into one write on exit.
+
+        Nothing is written if the block raises, so a half-applied update
+        never reaches disk.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            # Drop the deferred save so a later batch cannot flush it
+            if self._batch_depth == 1:
+                self._dirty = False
+            raise
+        finally:
+            self._batch_depth -= 1
+
+        if not self._batch_depth and self._dirty:
+            self._dirty = False
+            self.progress_mgr.save_progress(self.progress)
+
     def list_lessons(self, level: Optional[str] = None) -> None:
         """
         List all lessons, optionally filtered by level.
@@ -81,20 +132,20 @@ class LinuxTutor:
         Args:
             level: Optional level to filter by
         """
-        from lessons import LESSONS
-
-        if level and level not in VALID_LEVELS:
-            print(f"Invalid level. Choose from: {', '.join(VALID_LEVELS)}")
+        if level and level not in VALID_LEVEL_SET:
+            print(f"Invalid level. Choose from: {VALID_LEVELS_TEXT}")
             return
 
+        from lessons import LESSONS_BY_LEVEL
+
         target_level = level if level else self.progress['current_level']
-        lesson_ids = get_lessons_by_level(LESSONS, target_level)
+        lesson_ids = LESSONS_BY_LEVEL.get(target_level)
 
         if not lesson_ids:
             print(f"\nNo lessons available for {target_level} level yet.")
             return
 
-        completed = set(self.progress['completed_lessons'])
+        completed = self._completed_set()
         display_lesson_list(lesson_ids, target_level, completed)
 
     def start_lesson(self, lesson_name: str) -> None:
@@ -112,7 +163,7 @@ class LinuxTutor:
             return
 
         # Check prerequisites
-        completed = set(self.progress['completed_lessons'])
+        completed = self._completed_set()
         prereqs_met, missing = check_prerequisites(lesson, completed)
 
         if not prereqs_met:
@@ -120,7 +171,7 @@ class LinuxTutor:
             return
 
         # Update progress
-        self.progress = self.progress_mgr.set_current_lesson(self.progress, lesson_name)
+        self.progress_mgr.set_current_lesson(self.progress, lesson_name)
         self.save_progress()
 
         # Display lesson info
@@ -152,7 +203,7 @@ class LinuxTutor:
             return
 
         # Check prerequisites
-        completed = set(self.progress['completed_lessons'])
+        completed = self._completed_set()
         prereqs_met, missing = check_prerequisites(lesson, completed)
 
         if not prereqs_met:
@@ -172,7 +223,14 @@ class LinuxTutor:
         Args:
             lesson_name: Lesson ID to mark complete
         """
-        self.progress = self.progress_mgr.mark_lesson_complete(self.progress, lesson_name)
+        progress = self.progress
+        if (lesson_name in progress['completed_lessons']
+                and progress.get('current_lesson') is None):
+            # Already recorded and nothing in progress: no state to save
+            display_lesson_completion(lesson_name)
+            return
+
+        self.progress_mgr.mark_lesson_complete(progress, lesson_name)
         self.save_progress()
         display_lesson_completion(lesson_name)
 
@@ -183,12 +241,14 @@ class LinuxTutor:
         Args:
             level: Level to set
         """
-        if level not in VALID_LEVELS:
-            print(f"Invalid level. Choose from: {', '.join(VALID_LEVELS)}")
+        if level not in VALID_LEVEL_SET:
+            print(f"Invalid level. Choose from: {VALID_LEVELS_TEXT}")
             return
 
-        self.progress = self.progress_mgr.set_level(self.progress, level)
-        self.save_progress()
+        progress = self.progress
+        if progress['current_level'] != level:
+            self.progress_mgr.set_level(progress, level)
+            self.save_progress()
         print(f"Level set to: {level}")
 
     def search_lessons(self, keywords: list, level_filter: Optional[str] = None) -> None:
@@ -206,18 +266,18 @@ class LinuxTutor:
             print("Usage: linuxtutor search <keyword> [<keyword2> ...]")
             return
 
-        results = search_fn(keywords)
-
-        if level_filter:
-            results = [r for r in results if r['lesson_data']['level'] == level_filter]
+        results = search_fn(keywords, level_filter)
 
         if not results:
-            print(f"\nNo lessons found matching: {', '.join(keywords)}")
-            print("\nTry:")
-            print("  - Using fewer or different keywords")
+            lines = [
+                f"\nNo lessons found matching: {', '.join(keywords)}",
+                "\nTry:",
+                "  - Using fewer or different keywords"
+            ]
             if level_filter:
-                print("  - Searching without --level filter")
-            print("  - Running 'linuxtutor lessons' to browse all lessons")
+                lines.append("  - Searching without --level filter")
+            lines.append("  - Running 'linuxtutor lessons' to browse all lessons")
+            print('\n'.join(lines))
             return
 
         display_search_results(results, keywords)
@@ -242,17 +302,37 @@ class LinuxTutor:
 
     # === Private Helper Methods ===
 
+    def _completed_set(self) -> Set[str]:
+        """
+        Get completed lesson IDs as a set for O(1) membership tests.
+
+        Returns:
+            Set of completed lesson IDs
+        """
+        return set(self.progress['completed_lessons'])
+
+    def _next_available_lesson(self, level: str) -> Optional[str]:
+        """Find the next available lesson at a level using the precomputed grouping."""
+        from lessons import LESSONS, LESSONS_BY_LEVEL
+
+        return get_next_available_lesson(
+            LESSONS,
+            level,
+            self._completed_set(),
+            LESSONS_BY_LEVEL.get(level, ())
+        )
+
     def show_welcome(self) -> None:
         """Welcome flow for first-time users."""
         display_welcome_message(True, str(self.config_dir))
 
         # Mark as not first time since they've been welcomed
-        self.progress = self.progress_mgr.mark_not_first_time(self.progress)
+        self.progress_mgr.mark_not_first_time(self.progress)
         self.save_progress()
 
         if not prompt_yes_no("\nReady to start your first lesson? [Y/n]: "):
-            print("\nNo problem! When you're ready, run:")
-            print("  linuxtutor start")
+            print("\nNo problem! When you're ready, run:\n"
+                  "  linuxtutor start")
             display_generic_options()
             return
 
@@ -263,15 +343,16 @@ class LinuxTutor:
         """Smart continuation for returning users."""
         from lessons import LESSONS
 
-        current_lesson = self.progress.get('current_lesson')
-        completed_count = len(self.progress['completed_lessons'])
-        level = self.progress['current_level']
+        progress = self.progress
+        current_lesson = progress.get('current_lesson')
+        completed_count = len(progress['completed_lessons'])
+        level = progress['current_level']
 
         display_welcome_message(False, str(self.config_dir))
 
         # Option 1: Continue ongoing lesson
         if current_lesson:
-            print(f"You have an ongoing lesson: {current_lesson.replace('-', ' ').title()}")
+            print(f"You have an ongoing lesson: {lesson_display_name(current_lesson)}")
             if prompt_yes_no("Continue this lesson? [Y/n]: "):
                 self.continue_lesson(current_lesson)
                 return
@@ -289,11 +370,7 @@ class LinuxTutor:
         # Option 3: Has completed lessons
         print(f"Progress: {completed_count} lessons completed ({level} level)")
 
-        next_lesson = get_next_available_lesson(
-            LESSONS,
-            level,
-            set(self.progress['completed_lessons'])
-        )
+        next_lesson = self._next_available_lesson(level)
 
         if next_lesson:
             next_title = LESSONS[next_lesson]['title']
@@ -303,9 +380,9 @@ class LinuxTutor:
                 display_continuing_lesson(next_title)
                 self.continue_lesson(next_lesson)
             else:
-                print("\nOther options:")
-                print("  linuxtutor lessons    # see all lessons")
-                print("  linuxtutor status     # check your progress")
+                print("\nOther options:\n"
+                      "  linuxtutor lessons    # see all lessons\n"
+                      "  linuxtutor status     # check your progress")
         else:
             self.handle_no_available_lessons()
 
@@ -313,30 +390,30 @@ class LinuxTutor:
         """Show interactive menu after completing a lesson."""
         from lessons import LESSONS
 
-        next_lesson = get_next_available_lesson(
-            LESSONS,
-            self.progress['current_level'],
-            set(self.progress['completed_lessons'])
-        )
+        level = self.progress['current_level']
+        next_lesson = self._next_available_lesson(level)
 
         if next_lesson:
             next_title = LESSONS[next_lesson]['title']
-            display_post_lesson_menu(True, next_title)
 
-            choice = prompt_choice("\nYour choice [1-4]: ")
+            while True:
+                display_post_lesson_menu(True, next_title)
+                choice = prompt_choice("\nYour choice [1-4]: ", on_eof='4')
+
+                # Viewing progress changes nothing, so the same menu comes back
+                if choice != '3':
+                    break
+                self.show_status()
+                prompt_press_enter()
 
             if choice == '1' or choice == '':
                 display_continuing_lesson(next_title)
                 self.continue_lesson(next_lesson)
             elif choice == '2':
-                self.list_lessons(self.progress['current_level'])
+                self.list_lessons(level)
                 lesson_id = prompt_lesson_selection()
                 if lesson_id and lesson_id != 'exit':
                     self.continue_lesson(lesson_id)
-            elif choice == '3':
-                self.show_status()
-                prompt_press_enter()
-                self.show_post_lesson_options(completed_lesson)
             elif choice == '4':
                 display_exit_message()
             else:
@@ -346,12 +423,13 @@ class LinuxTutor:
 
     def handle_no_available_lessons(self) -> None:
         """Handle when no lessons are available at current level."""
-        from lessons import LESSONS
+        from lessons import LESSONS, LESSONS_BY_LEVEL
 
         current_level = self.progress['current_level']
-        completed = set(self.progress['completed_lessons'])
+        completed = self._completed_set()
+        level_lessons = LESSONS_BY_LEVEL.get(current_level, ())
 
-        if are_all_lessons_completed(LESSONS, current_level, completed):
+        if are_all_lessons_completed(LESSONS, current_level, completed, level_lessons):
             print("Congratulations! You've completed all lessons in your current level.")
             self.suggest_level_up()
         else:
@@ -364,8 +442,6 @@ class LinuxTutor:
 
     def suggest_level_up(self) -> None:
         """Suggest moving to next level."""
-        from lessons import LESSONS
-
         level_progression = VALID_LEVELS
         current_level = self.progress['current_level']
 
@@ -377,11 +453,7 @@ class LinuxTutor:
 
                 if prompt_yes_no("Move to next level? [Y/n]: "):
                     self.set_level(next_level)
-                    next_lesson = get_next_available_lesson(
-                        LESSONS,
-                        next_level,
-                        set(self.progress['completed_lessons'])
-                    )
+                    next_lesson = self._next_available_lesson(next_level)
                     if next_lesson:
                         print(f"\nStarting your first {next_level} lesson!")
                         print(SEPARATOR_MEDIUM)
@@ -393,17 +465,17 @@ class LinuxTutor:
 
     def show_lesson_not_found_help_original(self, lesson_name: str) -> None:
         """Show helpful error when lesson doesn't exist."""
-        from lessons import LESSONS, search_lessons
+        from lessons import LESSONS, LESSON_IDS_LOWER, search_lessons
 
         display_lesson_not_found(lesson_name)
 
         # Try fuzzy search
-        similar = find_similar_lessons(lesson_name, LESSONS)
+        similar = find_similar_lessons(lesson_name, LESSONS, lesson_ids_lower=LESSON_IDS_LOWER)
         display_lesson_suggestions(similar)
 
-        # Search by keywords
-        keywords = lesson_name.split('-')
-        results = search_lessons(keywords)
+        # Fall back to searching by keywords only when no names were similar
+        keywords = [token for token in lesson_name.lower().split('-') if token]
+        results = search_lessons(keywords) if keywords and not similar else []
         if results:
             print("Lessons matching your search:")
             for i, result in enumerate(results[:3], 1):
@@ -420,16 +492,11 @@ class LinuxTutor:
 
     def get_next_lesson(self):
         """Get next available lesson (wrapper for backward compatibility)."""
-        from lessons import LESSONS
-        return get_next_available_lesson(
-            LESSONS,
-            self.progress['current_level'],
-            set(self.progress['completed_lessons'])
-        )
+        return self._next_available_lesson(self.progress['current_level'])
 
     def check_prerequisites(self, lesson_data, lesson_name):
         """Check prerequisites (wrapper for backward compatibility)."""
-        completed = set(self.progress['completed_lessons'])
+        completed = self._completed_set()
         prereqs_met, missing = check_prerequisites(lesson_data, completed)
         if not prereqs_met:
             display_prerequisites_error(lesson_name, missing)
@@ -440,8 +507,20 @@ class LinuxTutor:
         self.show_lesson_not_found_help_original(lesson_name)
 
 
-def main():
-    """Main entry point for the CLI."""
+# Help needs no progress state, so it is printed without creating a LinuxTutor
+_HELP_COMMANDS = frozenset(('help', '--help', '-h'))
+
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """
+    Build (once) the full argparse parser, used only for unusual command lines.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='LinuxTutor - Interactive Linux Learning',
         add_help=False
@@ -455,60 +534,140 @@ def main():
                        help='Filter by skill level')
     parser.add_argument('--help', '-h', action='store_true',
                        help='Show help message')
+    return parser
+
+
+def _parse_argv(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common command lines without importing argparse.
+
+    Accepts the same options as _build_parser() as long as the positional
+    arguments form one contiguous run. Anything else (unknown or abbreviated
+    options, a missing --level value, split positionals) is left to argparse
+    so its error messages are preserved.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        Namespace matching argparse's result, or None to fall back to argparse
+    """
+    positionals: List[str] = []
+    continue_lesson = False
+    level_filter = None
+    show_help = False
+    positionals_closed = False
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token.startswith('-') and token != '-':
+            if positionals:
+                positionals_closed = True
+            if token == '--continue':
+                continue_lesson = True
+            elif token in ('--help', '-h'):
+                show_help = True
+            elif token in ('--level', '-l'):
+                i += 1
+                if i == len(argv) or argv[i].startswith('-'):
+                    return None
+                level_filter = argv[i]
+            elif token.startswith('--level='):
+                level_filter = token[len('--level='):]
+            else:
+                return None
+        elif positionals_closed:
+            return None
+        else:
+            positionals.append(token)
+        i += 1
+
+    return SimpleNamespace(
+        command=positionals[0] if positionals else None,
+        args=positionals[1:],
+        continue_lesson=continue_lesson,
+        level_filter=level_filter,
+        help=show_help
+    )
 
-    args = parser.parse_args()
-    tutor = LinuxTutor()
+
+def _run_lessons(tutor: LinuxTutor, args) -> None:
+    """Handle `lessons [level]`: list lessons, optionally for one level."""
+    level = args.args[0] if args.args else None
+    tutor.list_lessons(level)
+
+
+def _run_lesson(tutor: LinuxTutor, args) -> None:
+    """Handle `lesson <name> [--continue]`: start or resume a lesson."""
+    if not args.args:
+        print("Error: Lesson name required")
+        print("Usage: linuxtutor lesson <lesson-name>")
+    elif args.continue_lesson:
+        tutor.continue_lesson(args.args[0])
+    else:
+        tutor.start_lesson(args.args[0])
+
+
+def _run_level(tutor: LinuxTutor, args) -> None:
+    """Handle `level [level]`: show or change the current level."""
+    if not args.args:
+        print(f"Current level: {tutor.progress['current_level']}")
+    else:
+        tutor.set_level(args.args[0])
+
+
+def _run_search(tutor: LinuxTutor, args) -> None:
+    """Handle `search <keywords> [--level]`: search lessons by keyword."""
+    if not args.args:
+        print("Error: Keywords required")
+        print("Usage: linuxtutor search <keyword> [<keyword2> ...]")
+    else:
+        tutor.search_lessons(args.args, args.level_filter)
+
+
+# Command table used once arguments are parsed: handler(tutor, args)
+_COMMANDS = {
+    'start': lambda tutor, args: tutor.start_learning(),
+    'status': lambda tutor, args: tutor.show_status(),
+    'lessons': _run_lessons,
+    'lesson': _run_lesson,
+    'level': _run_level,
+    'search': _run_search,
+}
+
+
+def main():
+    """Main entry point for the CLI."""
+    argv = sys.argv[1:]
+
+    # No command - show smart welcome without building the argument parser
+    if not argv:
+        display_welcome_banner(ProgressManager(_CONFIG_DIR).peek_first_time())
+        return
+
+    if argv[0] in _HELP_COMMANDS:
+        display_help_text()
+        return
+
+    args = _parse_argv(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
 
     # Handle --help flag
     if args.help:
-        tutor.show_help()
+        display_help_text()
         return
 
-    # No command - show smart welcome
-    if len(sys.argv) == 1:
-        is_first_time = tutor.progress.get('first_time', True)
-        if is_first_time:
-            print("Welcome to LinuxTutor!")
-            print("To get started, run: linuxtutor start")
-        else:
-            print("LinuxTutor - Interactive Linux Learning")
-            print("Run 'linuxtutor start' to continue learning or 'linuxtutor help' for options.")
-        return
+    tutor = LinuxTutor()
 
     # Execute command
-    if args.command == 'start':
-        tutor.start_learning()
-    elif args.command == 'status':
-        tutor.show_status()
-    elif args.command == 'lessons':
-        level = args.args[0] if args.args else None
-        tutor.list_lessons(level)
-    elif args.command == 'lesson':
-        if not args.args:
-            print("Error: Lesson name required")
-            print("Usage: linuxtutor lesson <lesson-name>")
-        else:
-            lesson_name = args.args[0]
-            if args.continue_lesson:
-                tutor.continue_lesson(lesson_name)
-            else:
-                tutor.start_lesson(lesson_name)
-    elif args.command == 'level':
-        if not args.args:
-            print(f"Current level: {tutor.progress['current_level']}")
-        else:
-            tutor.set_level(args.args[0])
-    elif args.command == 'search':
-        if not args.args:
-            print("Error: Keywords required")
-            print("Usage: linuxtutor search <keyword> [<keyword2> ...]")
-        else:
-            tutor.search_lessons(args.args, args.level_filter)
-    elif args.command == 'help' or args.command == '--help':
-        tutor.show_help()
-    else:
+    handler = _COMMANDS.get(args.command)
+    if handler is None:
         print(f"Unknown command: {args.command}")
         print("Run 'linuxtutor help' for usage information")
+    else:
+        handler(tutor, args)
 
 
 if __name__ == '__main__':
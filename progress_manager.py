@@ -1,8 +1,10 @@
 """Progress persistence and management."""
 
 import json
+import os
+import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from constants import (
     CONFIG_DIR_NAME,
     PROGRESS_FILE_NAME,
@@ -10,9 +12,17 @@ from constants import (
     DEFAULT_FIRST_TIME
 )
 
+# Matches a recorded first_time of false in either compact or indented JSON
+_NOT_FIRST_TIME = re.compile(rb'"first_time"\s*:\s*false')
+
 
 class ProgressManager:
-    """Handles loading, saving, and updating user progress."""
+    """
+    Handles loading, saving, and updating user progress.
+
+    The update methods modify the progress dict they are given in place;
+    they return it only as a convenience for chained or legacy callers.
+    """
 
     def __init__(self, config_dir: Path):
         """
@@ -23,6 +33,8 @@ class ProgressManager:
         """
         self.config_dir = config_dir
         self.progress_file = config_dir / PROGRESS_FILE_NAME
+        # Serialized form last read from or written to disk
+        self._saved_blob: Optional[bytes] = None
 
     def load_progress(self) -> Dict[str, Any]:
         """
@@ -31,33 +43,64 @@ class ProgressManager:
         Returns:
             Progress dictionary
         """
-        if self.progress_file.exists():
-            with open(self.progress_file, 'r') as f:
-                progress = json.load(f)
+        try:
+            with open(self.progress_file, 'rb') as f:
+                self._saved_blob = f.read()
+        except FileNotFoundError:
+            return self._create_default_progress()
+
+        progress = json.loads(self._saved_blob)
 
-            # Backward compatibility: Add missing fields
-            if 'stats' in progress:
-                # Add quiz stats if missing (for old progress files)
-                if 'quizzes_completed' not in progress['stats']:
-                    progress['stats']['quizzes_completed'] = 0
-                if 'quiz_total_attempts' not in progress['stats']:
-                    progress['stats']['quiz_total_attempts'] = 0
+        # Backward compatibility: Add missing fields
+        if 'stats' in progress:
+            # Add quiz stats if missing (for old progress files)
+            if 'quizzes_completed' not in progress['stats']:
+                progress['stats']['quizzes_completed'] = 0
+            if 'quiz_total_attempts' not in progress['stats']:
+                progress['stats']['quiz_total_attempts'] = 0
 
-            return progress
+        return progress
 
-        return self._create_default_progress()
+    def peek_first_time(self) -> bool:
+        """
+        Check whether the user is new without parsing the whole progress file.
+
+        Returns:
+            False once the user has been welcomed, True otherwise
+        """
+        try:
+            with open(self.progress_file, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return DEFAULT_FIRST_TIME
+
+        return _NOT_FIRST_TIME.search(data) is None
 
     def save_progress(self, progress: Dict[str, Any]) -> None:
         """
         Save progress to file.
 
+        The file is written compactly, synced, and replaced atomically;
+        nothing is written when the serialized progress matches what is
+        already on disk.
+
         Args:
             progress: Progress dictionary to save
         """
+        # Compact separators let json use its C encoder (indent forces pure Python)
+        blob = json.dumps(progress, separators=(',', ':')).encode()
+        if blob == self._saved_blob:
+            return
+
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
+        tmp_file = self.progress_file.with_name(self.progress_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.progress_file)
+        self._saved_blob = blob
 
     def _create_default_progress(self) -> Dict[str, Any]:
         """
@@ -88,7 +131,7 @@ class ProgressManager:
             lesson_name: Lesson ID to mark as complete
 
         Returns:
-            Updated progress dictionary
+            The same progress dictionary, updated in place
         """
         if lesson_name not in progress['completed_lessons']:
             progress['completed_lessons'].append(lesson_name)
@@ -106,7 +149,7 @@ class ProgressManager:
             lesson_name: Lesson ID to set as current
 
         Returns:
-            Updated progress dictionary
+            The same progress dictionary, updated in place
         """
         progress['current_lesson'] = lesson_name
         return progress
@@ -120,7 +163,7 @@ class ProgressManager:
             level: New level to set
 
         Returns:
-            Updated progress dictionary
+            The same progress dictionary, updated in place
         """
         progress['current_level'] = level
         return progress
@@ -134,7 +177,7 @@ class ProgressManager:
             count: Number of exercises to add
 
         Returns:
-            Updated progress dictionary
+            The same progress dictionary, updated in place
         """
         progress['stats']['exercises_completed'] += count
         return progress
@@ -147,7 +190,7 @@ class ProgressManager:
             progress: Current progress dictionary
 
         Returns:
-            Updated progress dictionary
+            The same progress dictionary, updated in place
         """
         progress['first_time'] = False
         return progress
@@ -161,7 +204,7 @@ class ProgressManager:
             attempts: Number of attempts in the quiz
 
         Returns:
-            Updated progress dictionary
+            The same progress dictionary, updated in place
         """
         progress['stats']['quizzes_completed'] += 1
         progress['stats']['quiz_total_attempts'] += attempts
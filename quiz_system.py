@@ -1,12 +1,22 @@
 """Quiz system for LinuxTutor lessons."""
 
 from typing import Dict, Any, List
-from constants import QUIZ_CHECKMARK, QUIZ_CROSSMARK, QUIZ_SEPARATOR
+from constants import (
+    AFFIRMATIVE_RESPONSES, QUIZ_CHECKMARK, QUIZ_CROSSMARK, QUIZ_SEPARATOR
+)
+
+# Accepted answer spellings, built once instead of on every validation
+_CHOICE_LETTERS = frozenset(('a', 'b', 'c', 'd'))
+_TRUE_INPUTS = frozenset(('true', 't', 'yes', 'y', '1'))
+_FALSE_INPUTS = frozenset(('false', 'f', 'no', 'n', '0'))
 
 
 class QuizQuestion:
     """Base class for quiz questions."""
 
+    # Slots keep question instances small; subclasses declare their own fields
+    __slots__ = ('question_text', 'explanation')
+
     def __init__(self, data: Dict[str, Any]):
         """
         Initialize quiz question.
@@ -40,14 +50,18 @@ class QuizQuestion:
         """
         raise NotImplementedError("Subclasses must implement validate_answer()")
 
-    def display(self) -> None:
+    def render(self) -> str:
         """
-        Display the question.
+        Build the question text as shown to the user.
 
         Raises:
             NotImplementedError: Must be implemented by subclasses
         """
-        raise NotImplementedError("Subclasses must implement display()")
+        raise NotImplementedError("Subclasses must implement render()")
+
+    def display(self) -> None:
+        """Display the question."""
+        print(self.render())
 
     def get_explanation(self) -> str:
         """Get the explanation for this question."""
@@ -57,6 +71,8 @@ class QuizQuestion:
 class MultipleChoiceQuestion(QuizQuestion):
     """Multiple choice question with A/B/C/D options."""
 
+    __slots__ = ('options', 'correct_index', '_rendered', '_answer_map')
+
     def __init__(self, data: Dict[str, Any]):
         """
         Initialize multiple choice question.
@@ -76,6 +92,20 @@ class MultipleChoiceQuestion(QuizQuestion):
         self.options = data['options']
         self.correct_index = data['correct']
 
+        # The question is redisplayed on every retry, so lay it out once
+        lines = [self.question_text, ""]
+        for i, option in enumerate(self.options):
+            letter = chr(ord('A') + i)
+            lines.append(f"{letter}) {option}")
+        self._rendered = '\n'.join(lines)
+
+        # Every accepted spelling mapped to its option index: a-d and 0-based digits
+        self._answer_map = {str(i): i for i in range(len(self.options))}
+        for letter in _CHOICE_LETTERS:
+            index = ord(letter) - ord('a')
+            if index < len(self.options):
+                self._answer_map[letter] = index
+
     def validate_answer(self, user_input: str) -> bool:
         """
         Validate user's answer.
@@ -88,36 +118,18 @@ class MultipleChoiceQuestion(QuizQuestion):
         Returns:
             True if correct, False otherwise
         """
-        user_input = user_input.strip().lower()
+        return self._answer_map.get(user_input.strip().lower()) == self.correct_index
 
-        # Check if it's a letter (a/b/c/d)
-        if user_input in ['a', 'b', 'c', 'd']:
-            letter_index = ord(user_input) - ord('a')
-            if letter_index >= len(self.options):  # Add this check
-                return False
-            return letter_index == self.correct_index
-
-        # Check if it's a number (0/1/2/3)
-        if user_input.isdigit():
-            idx = int(user_input)
-            if idx >= len(self.options):  # Add this check
-                return False
-            return idx == self.correct_index
-
-        return False
-
-    def display(self) -> None:
-        """Display the question with options."""
-        print(self.question_text)
-        print()
-        for i, option in enumerate(self.options):
-            letter = chr(ord('A') + i)
-            print(f"{letter}) {option}")
+    def render(self) -> str:
+        """Return the question text with lettered options."""
+        return self._rendered
 
 
 class TrueFalseQuestion(QuizQuestion):
     """True/False question."""
 
+    __slots__ = ('correct_answer',)
+
     def __init__(self, data: Dict[str, Any]):
         """
         Initialize true/false question.
@@ -148,26 +160,23 @@ class TrueFalseQuestion(QuizQuestion):
         """
         user_input = user_input.strip().lower()
 
-        # Map inputs to boolean values
-        true_inputs = ['true', 't', 'yes', 'y', '1']
-        false_inputs = ['false', 'f', 'no', 'n', '0']
-
-        if user_input in true_inputs:
+        if user_input in _TRUE_INPUTS:
             return self.correct_answer is True
-        elif user_input in false_inputs:
+        elif user_input in _FALSE_INPUTS:
             return self.correct_answer is False
         else:
             return False
 
-    def display(self) -> None:
-        """Display the question."""
-        print(self.question_text)
-        print("\n[True/False]")
+    def render(self) -> str:
+        """Build the question text."""
+        return f"{self.question_text}\n\n[True/False]"
 
 
 class TextAnswerQuestion(QuizQuestion):
     """Base class for questions with text answers and alternatives."""
 
+    __slots__ = ('correct_answer', 'alternatives', '_valid_answers')
+
     def __init__(self, data: Dict[str, Any]):
         """Initialize text answer question."""
         super().__init__(data)
@@ -175,6 +184,8 @@ class TextAnswerQuestion(QuizQuestion):
             raise ValueError(f"{self.__class__.__name__} must contain 'answer' key")
         self.correct_answer = data['answer']
         self.alternatives = data.get('alternatives', [])
+        # The answer and its alternatives as one set, so validation is one probe
+        self._valid_answers = frozenset((self.correct_answer, *self.alternatives))
 
     def validate_answer(self, user_input: str) -> bool:
         """
@@ -188,35 +199,27 @@ class TextAnswerQuestion(QuizQuestion):
         Returns:
             True if correct, False otherwise
         """
-        user_input = user_input.strip()
-
-        # Check exact answer
-        if user_input == self.correct_answer:
-            return True
-
-        # Check alternatives
-        if user_input in self.alternatives:
-            return True
-
-        return False
+        return user_input.strip() in self._valid_answers
 
 
 class CommandRecallQuestion(TextAnswerQuestion):
     """Question asking user to recall a specific command."""
 
-    def display(self) -> None:
-        """Display the question."""
-        print(self.question_text)
-        print("\n[Type the command]")
+    __slots__ = ()
+
+    def render(self) -> str:
+        """Build the question text."""
+        return f"{self.question_text}\n\n[Type the command]"
 
 
 class FillBlankQuestion(TextAnswerQuestion):
     """Fill in the blank question."""
 
-    def display(self) -> None:
-        """Display the question."""
-        print(self.question_text)
-        print("\n[Fill in the blank]")
+    __slots__ = ()
+
+    def render(self) -> str:
+        """Build the question text."""
+        return f"{self.question_text}\n\n[Fill in the blank]"
 
 
 class Quiz:
@@ -240,13 +243,14 @@ class Quiz:
         Raises:
             ValueError: If unknown question type encountered
         """
+        question_types = self.QUESTION_TYPES
         self.questions = []
         for q_data in quiz_data:
             q_type = q_data.get('type')
-            if q_type not in self.QUESTION_TYPES:
+            question_class = question_types.get(q_type)
+            if question_class is None:
                 raise ValueError(f"Unknown question type: {q_type}")
 
-            question_class = self.QUESTION_TYPES[q_type]
             self.questions.append(question_class(q_data))
 
 
@@ -272,37 +276,41 @@ class QuizRunner:
         total_attempts = 0
         total_questions = len(self.quiz.questions)
 
-        print("\n" + "━" * 42)
-        print("Time to test your knowledge!")
-        print("━" * 42)
-        print(f"\nYou'll answer {total_questions} questions about what you just learned.")
-        print("You can retake questions until you get them right.\n")
+        print('\n'.join([
+            "\n" + "━" * 42,
+            "Time to test your knowledge!",
+            "━" * 42,
+            f"\nYou'll answer {total_questions} questions about what you just learned.",
+            "You can retake questions until you get them right.\n",
+        ]))
 
         try:
             for i, question in enumerate(self.quiz.questions, 1):
+                # Built once and reprinted verbatim on each retry
+                block = (f"\nQuestion {i} of {total_questions}\n"
+                         f"{QUIZ_SEPARATOR}\n"
+                         f"{question.render()}")
                 while True:
                     total_attempts += 1
 
                     # Display question
-                    print(f"\nQuestion {i} of {total_questions}")
-                    print(QUIZ_SEPARATOR)
-                    question.display()
+                    print(block)
 
                     # Get answer
                     user_answer = input("\nYour answer: ").strip()
 
                     # Validate
                     if question.validate_answer(user_answer):
-                        print(f"\n{QUIZ_CHECKMARK} Correct!")
-                        print(f"\nExplanation: {question.get_explanation()}")
+                        print(f"\n{QUIZ_CHECKMARK} Correct!\n"
+                              f"\nExplanation: {question.get_explanation()}")
                         input("\n[Press Enter to continue...]")
                         break
                     else:
-                        print(f"\n{QUIZ_CROSSMARK} Incorrect.")
-                        print(f"\nExplanation: {question.get_explanation()}")
+                        print(f"\n{QUIZ_CROSSMARK} Incorrect.\n"
+                              f"\nExplanation: {question.get_explanation()}")
 
                         retry = input("\nTry again? [Y/n]: ").strip().lower()
-                        if retry not in ['', 'y', 'yes']:
+                        if retry not in AFFIRMATIVE_RESPONSES:
                             # User chose not to retry - quiz incomplete
                             return (total_attempts, False)
 
@@ -318,16 +326,19 @@ class QuizRunner:
 
     def _show_completion(self, attempts: int, total: int) -> None:
         """Show quiz completion summary."""
-        print("\n" + "━" * 42)
-        print("Quiz Complete!")
-        print("━" * 42)
-        print(f"\nYou answered all {total} questions correctly!")
+        lines = [
+            "\n" + "━" * 42,
+            "Quiz Complete!",
+            "━" * 42,
+            f"\nYou answered all {total} questions correctly!",
+        ]
 
         retries = attempts - total
         if retries > 0:
             plural = 's' if retries > 1 else ''
-            print(f"Total attempts: {attempts} ({retries} question{plural} needed retries)")
+            lines.append(f"Total attempts: {attempts} ({retries} question{plural} needed retries)")
         else:
-            print("Perfect score - all correct on first try!")
+            lines.append("Perfect score - all correct on first try!")
 
-        print("\nGreat job!")
+        lines.append("\nGreat job!")
+        print('\n'.join(lines))
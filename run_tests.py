@@ -17,6 +17,9 @@ import unittest
 import argparse
 from pathlib import Path
 
+# Directory holding this script; tests are discovered relative to it
+_HERE = Path(__file__).resolve().parent
+
 
 def discover_tests(test_dir='tests', pattern='test_*.py'):
     """
@@ -30,7 +33,7 @@ def discover_tests(test_dir='tests', pattern='test_*.py'):
         TestSuite containing all discovered tests
     """
     loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent / test_dir
+    start_dir = _HERE / test_dir
 
     if not start_dir.exists():
         print(f"Error: Test directory '{test_dir}' not found", file=sys.stderr)
@@ -40,7 +43,7 @@ def discover_tests(test_dir='tests', pattern='test_*.py'):
     suite = loader.discover(
         start_dir=str(start_dir),
         pattern=pattern,
-        top_level_dir=str(Path(__file__).parent)
+        top_level_dir=str(_HERE)
     )
 
     return suite
@@ -48,13 +51,7 @@ def discover_tests(test_dir='tests', pattern='test_*.py'):
 
 def count_tests(suite):
     """Count total number of tests in a test suite."""
-    count = 0
-    for test in suite:
-        if isinstance(test, unittest.TestSuite):
-            count += count_tests(test)
-        else:
-            count += 1
-    return count
+    return suite.countTestCases()
 
 
 def run_tests(verbosity=1, pattern='test_*.py', failfast=False):
@@ -5,19 +5,24 @@ import sys
 import shutil
 from pathlib import Path
 
+# Directory holding the LinuxTutor sources
+_HERE = Path(__file__).resolve().parent
+
 def create_symlink():
     """Create a symlink to make linuxtutor available system-wide"""
-    script_path = Path(__file__).parent / 'linuxtutor.py'
+    script_path = _HERE / 'linuxtutor.py'
     local_bin = Path.home() / '.local' / 'bin'
     local_bin.mkdir(parents=True, exist_ok=True)
     
     symlink_path = local_bin / 'linuxtutor'
     
-    if symlink_path.exists():
-        symlink_path.unlink()
-    
     try:
-        symlink_path.symlink_to(script_path.absolute())
+        try:
+            symlink_path.symlink_to(script_path)
+        except FileExistsError:
+            # Replace an earlier install, including a dangling link
+            symlink_path.unlink()
+            symlink_path.symlink_to(script_path)
         print(f"✓ Created symlink: {symlink_path} -> {script_path}")
         return True
     except OSError as e:
@@ -27,7 +32,7 @@ def create_symlink():
 def check_path():
     """Check if ~/.local/bin is in PATH"""
     local_bin = str(Path.home() / '.local' / 'bin')
-    path_dirs = os.environ.get('PATH', '').split(':')
+    path_dirs = set(os.environ.get('PATH', '').split(os.pathsep))
     
     if local_bin in path_dirs:
         print(f"✓ {local_bin} is in your PATH")
@@ -61,7 +66,7 @@ def install():
     
     print("\n" + "=" * 40)
     print("Installation Summary:")
-    print(f"✓ LinuxTutor files: {Path(__file__).parent}")
+    print(f"✓ LinuxTutor files: {_HERE}")
     print(f"✓ Executable link: ~/.local/bin/linuxtutor")
     
     if path_ok:
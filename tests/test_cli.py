@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for command-line argument parsing in linuxtutor."""
+
+import unittest
+import sys
+import io
+import contextlib
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from linuxtutor import _parse_argv, _build_parser
+
+
+class TestParseArgv(unittest.TestCase):
+    """Test the argparse-free parser against the full argparse parser."""
+
+    def assert_matches_argparse(self, command_line):
+        """Assert both parsers produce the same namespace for a command line."""
+        argv = command_line.split()
+        expected = vars(_build_parser().parse_args(argv))
+        self.assertEqual(vars(_parse_argv(argv)), expected, command_line)
+
+    def test_common_command_lines(self):
+        """Test everyday command lines parse like argparse."""
+        for command_line in [
+            'start',
+            'status',
+            'lessons beginner',
+            'lesson intro-to-terminal',
+            'lesson intro-to-terminal --continue',
+            '--continue lesson intro-to-terminal',
+            'level expert',
+            'search file permissions',
+            'search process --level intermediate',
+            'search process -l intermediate',
+            '-l advanced search network',
+            'search process --level=expert',
+            'search terminal --help',
+        ]:
+            self.assert_matches_argparse(command_line)
+
+    def test_unusual_command_lines_fall_back(self):
+        """Test command lines argparse must judge are not parsed by hand."""
+        for command_line in [
+            'search --lev beginner terminal',
+            'search -lbeginner terminal',
+            'search terminal --level',
+            'search --level -x terminal',
+            'search terminal -l beginner files',
+            'lesson --continue intro-to-terminal',
+            'search -- terminal',
+        ]:
+            self.assertIsNone(_parse_argv(command_line.split()), command_line)
+
+    def test_split_positionals_are_an_argparse_error(self):
+        """Test the fallback case really is rejected by argparse."""
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                _build_parser().parse_args('search terminal -l beginner files'.split())
+
+
+if __name__ == '__main__':
+    unittest.main()
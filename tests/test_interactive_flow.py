@@ -99,6 +99,32 @@ class TestInteractiveFlow(unittest.TestCase):
         sys.stdout = old_stdout
         builtins.input = old_input
 
+    def test_post_lesson_view_progress_repeatedly(self):
+        """Test viewing progress twice redisplays the menu without re-finding the next lesson."""
+        self.tutor.progress['completed_lessons'] = ['intro-to-terminal']
+
+        old_stdout = sys.stdout
+        old_input = builtins.input
+        sys.stdout = StringIO()
+
+        input_sequence = ['3', '', '3', '', '4']
+        input_iter = iter(input_sequence)
+        builtins.input = lambda _: next(input_iter)
+
+        with patch.object(self.tutor, 'show_status') as mock_status:
+            with patch.object(self.tutor, '_next_available_lesson',
+                              wraps=self.tutor._next_available_lesson) as mock_next:
+                self.tutor.show_post_lesson_options('intro-to-terminal')
+
+                self.assertEqual(mock_status.call_count, 2)
+                mock_next.assert_called_once()
+
+        output = sys.stdout.getvalue()
+        sys.stdout = old_stdout
+        builtins.input = old_input
+
+        self.assertEqual(output.count('What would you like to do next?'), 3)
+
     def test_post_lesson_choose_different_lesson(self):
         """Test user can choose a different lesson after completing one."""
         old_stdout = sys.stdout
@@ -240,6 +266,46 @@ class TestInteractiveFlow(unittest.TestCase):
         builtins.input = old_input
 
 
+class TestClosedStdin(unittest.TestCase):
+    """Test prompts degrade gracefully when stdin is exhausted."""
+
+    def test_yes_no_prompt_declines_on_eof(self):
+        """Test a yes/no prompt answers no instead of raising EOFError."""
+        from ui_prompts import prompt_yes_no
+
+        with patch('builtins.input', side_effect=EOFError), \
+                patch('sys.stdout', new_callable=StringIO):
+            self.assertFalse(prompt_yes_no("Continue? [Y/n]: "))
+
+    def test_first_run_welcome_completes_without_input(self):
+        """Test the first-run welcome finishes when no input is available."""
+        tutor = LinuxTutor()
+        tutor.progress['first_time'] = True
+
+        with patch('builtins.input', side_effect=EOFError), \
+                patch('sys.stdout', new_callable=StringIO) as mock_stdout, \
+                patch.object(tutor, 'save_progress'), \
+                patch.object(tutor, 'continue_lesson') as mock_continue:
+            tutor.start_learning()
+
+        mock_continue.assert_not_called()
+        self.assertIn('linuxtutor start', mock_stdout.getvalue())
+
+    def test_run_lesson_quits_on_eof(self):
+        """Test a lesson stops at its first command instead of raising EOFError."""
+        from lessons import run_lesson
+
+        tutor = LinuxTutor()
+
+        with patch('builtins.input', side_effect=EOFError), \
+                patch('sys.stdout', new_callable=StringIO) as mock_stdout, \
+                patch.object(tutor, 'complete_lesson') as mock_complete:
+            run_lesson(get_lesson('intro-to-terminal'), tutor)
+
+        mock_complete.assert_not_called()
+        self.assertIn('Lesson interrupted.', mock_stdout.getvalue())
+
+
 class TestGetNextLesson(unittest.TestCase):
     """Test get_next_lesson works correctly."""
 
@@ -255,6 +321,17 @@ class TestGetNextLesson(unittest.TestCase):
         self.assertIn(next_lesson, LESSONS)
         self.assertEqual(LESSONS[next_lesson]['level'], 'beginner')
 
+    def test_completed_set_follows_in_place_edits(self):
+        """Test replacing a completed entry in place is seen by later checks."""
+        first_lesson = self.tutor.get_next_lesson()
+        completed = self.tutor.progress['completed_lessons']
+        completed.append(first_lesson)
+        self.assertNotEqual(self.tutor.get_next_lesson(), first_lesson)
+
+        # Same list object, same length, different contents
+        completed[0] = 'security-basics'
+        self.assertEqual(self.tutor.get_next_lesson(), first_lesson)
+
     def test_get_next_lesson_skips_completed(self):
         """Test that get_next_lesson skips completed lessons."""
         # Get first lesson
@@ -270,6 +347,18 @@ class TestGetNextLesson(unittest.TestCase):
         self.assertNotEqual(first_lesson, second_lesson)
         self.assertNotIn(second_lesson, self.tutor.progress['completed_lessons'])
 
+    def test_get_next_lesson_after_complete_lesson(self):
+        """Test completing a lesson is reflected in the next suggestion."""
+        first_lesson = self.tutor.get_next_lesson()
+
+        with patch.object(self.tutor, 'save_progress'), \
+                patch('sys.stdout', new_callable=StringIO):
+            self.tutor.complete_lesson(first_lesson)
+
+        second_lesson = self.tutor.get_next_lesson()
+        self.assertNotEqual(first_lesson, second_lesson)
+        self.assertIn(first_lesson, self.tutor.progress['completed_lessons'])
+
     def test_get_next_lesson_all_completed_returns_none(self):
         """Test that get_next_lesson returns None when all lessons completed."""
         # Complete all beginner lessons
@@ -9,7 +9,7 @@ from pathlib import Path
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from lessons import LESSONS, get_lesson
+from lessons import LESSONS, LESSONS_BY_LEVEL, get_lesson
 from linuxtutor import LinuxTutor
 
 
@@ -188,6 +188,18 @@ class TestDynamicLessonListing(unittest.TestCase):
 
                 self.assertIn(f'{level.title()} Level Lessons:', output)
 
+    def test_lessons_by_level_matches_lessons(self):
+        """Test the precomputed level index covers every lesson, sorted."""
+        for level, lesson_ids in LESSONS_BY_LEVEL.items():
+            with self.subTest(level=level):
+                expected = sorted(
+                    lid for lid, data in LESSONS.items() if data['level'] == level
+                )
+                self.assertEqual(list(lesson_ids), expected)
+
+        indexed = sum(len(ids) for ids in LESSONS_BY_LEVEL.values())
+        self.assertEqual(indexed, len(LESSONS))
+
 
 class TestPrerequisiteValidation(unittest.TestCase):
     """Test prerequisite validation functionality."""
@@ -308,6 +320,45 @@ class TestErrorMessages(unittest.TestCase):
         # Should show suggestions
         self.assertIn('Did you mean:', output)
 
+    def test_error_message_suggests_near_miss(self):
+        """Test a single mistyped character still yields a suggestion."""
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+
+        self.tutor.show_lesson_not_found_help('file-pwrmissions')
+
+        output = sys.stdout.getvalue()
+        sys.stdout = old_stdout
+
+        self.assertIn('Did you mean:', output)
+        self.assertIn('file-permissions', output)
+
+    def test_error_message_suggests_dropped_letter(self):
+        """Test a missing character still yields a suggestion."""
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+
+        self.tutor.show_lesson_not_found_help('file-permisions')
+
+        output = sys.stdout.getvalue()
+        sys.stdout = old_stdout
+
+        self.assertIn('Did you mean:', output)
+        self.assertIn('file-permissions', output)
+
+    def test_keyword_search_skipped_when_similar_found(self):
+        """Test keyword matches are only listed when no names were similar."""
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+
+        self.tutor.show_lesson_not_found_help('file-perm')
+
+        output = sys.stdout.getvalue()
+        sys.stdout = old_stdout
+
+        self.assertIn('Did you mean:', output)
+        self.assertNotIn('Lessons matching your search', output)
+
     def test_start_lesson_uses_error_helper(self):
         """Test that start_lesson uses the error helper for missing lessons."""
         old_stdout = sys.stdout
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Tests for progress persistence in ProgressManager."""
+
+import unittest
+import sys
+import json
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from progress_manager import ProgressManager
+from linuxtutor import LinuxTutor
+
+
+class TestSaveProgress(unittest.TestCase):
+    """Test writing progress to disk."""
+
+    def setUp(self):
+        """Set up a progress manager in a temporary directory."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        self.config_dir = Path(temp_dir) / '.linuxtutor'
+        self.progress_mgr = ProgressManager(self.config_dir)
+
+    def test_save_round_trip(self):
+        """Test saved progress loads back unchanged."""
+        progress = self.progress_mgr.load_progress()
+        progress['completed_lessons'].append('intro-to-terminal')
+        self.progress_mgr.save_progress(progress)
+
+        loaded = ProgressManager(self.config_dir).load_progress()
+        self.assertEqual(loaded, progress)
+
+    def test_save_leaves_no_temp_file(self):
+        """Test the atomic write does not leave its temp file behind."""
+        self.progress_mgr.save_progress(self.progress_mgr.load_progress())
+
+        files = sorted(p.name for p in self.config_dir.iterdir())
+        self.assertEqual(files, ['progress.json'])
+
+    def test_unchanged_progress_not_rewritten(self):
+        """Test saving identical progress skips the write."""
+        progress = self.progress_mgr.load_progress()
+        self.progress_mgr.save_progress(progress)
+
+        # Tamper with the file; an unchanged save must not touch it
+        self.progress_mgr.progress_file.write_text('{}')
+        self.progress_mgr.save_progress(progress)
+        self.assertEqual(json.loads(self.progress_mgr.progress_file.read_text()), {})
+
+        progress['current_level'] = 'expert'
+        self.progress_mgr.save_progress(progress)
+        saved = json.loads(self.progress_mgr.progress_file.read_text())
+        self.assertEqual(saved['current_level'], 'expert')
+
+    def test_peek_first_time(self):
+        """Test first_time is read without a full load, in both JSON layouts."""
+        self.assertTrue(self.progress_mgr.peek_first_time())
+
+        progress = self.progress_mgr.load_progress()
+        self.progress_mgr.save_progress(progress)
+        self.assertTrue(self.progress_mgr.peek_first_time())
+
+        self.progress_mgr.save_progress(self.progress_mgr.mark_not_first_time(progress))
+        self.assertFalse(self.progress_mgr.peek_first_time())
+
+        # Progress files written by older versions were indented
+        self.progress_mgr.progress_file.write_text(json.dumps(progress, indent=2))
+        self.assertFalse(self.progress_mgr.peek_first_time())
+
+
+class TempTutorMixin:
+    """Give each test a LinuxTutor backed by a temporary progress file."""
+
+    def setUp(self):
+        """Set up a tutor whose progress directory is removed after the test."""
+        config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, config_dir)
+        self.tutor = LinuxTutor()
+        self.tutor.progress_mgr = ProgressManager(Path(config_dir))
+        self.tutor.progress = self.tutor.progress_mgr.load_progress()
+
+
+class TestBatchedSave(TempTutorMixin, unittest.TestCase):
+    """Test coalescing of LinuxTutor progress writes."""
+
+    def test_saves_inside_batch_write_once(self):
+        """Test several saves inside a batch produce a single write."""
+        with patch.object(self.tutor.progress_mgr, 'save_progress') as mock_save:
+            with self.tutor.batched_save():
+                self.tutor.save_progress()
+                with self.tutor.batched_save():
+                    self.tutor.save_progress()
+                self.assertEqual(mock_save.call_count, 0)
+
+            mock_save.assert_called_once_with(self.tutor.progress)
+
+    def test_batch_without_saves_does_not_write(self):
+        """Test a batch with no save requests leaves the disk alone."""
+        with patch.object(self.tutor.progress_mgr, 'save_progress') as mock_save:
+            with self.tutor.batched_save():
+                pass
+
+            mock_save.assert_not_called()
+
+    def test_batch_that_raises_does_not_write(self):
+        """Test a block that fails partway leaves the saved progress untouched."""
+        with patch.object(self.tutor.progress_mgr, 'save_progress') as mock_save:
+            with self.assertRaises(RuntimeError):
+                with self.tutor.batched_save():
+                    self.tutor.save_progress()
+                    raise RuntimeError("interrupted")
+
+            # An empty batch afterwards must not flush the abandoned save
+            with self.tutor.batched_save():
+                pass
+
+            mock_save.assert_not_called()
+
+        # The batch is closed, so later saves write immediately again
+        with patch.object(self.tutor.progress_mgr, 'save_progress') as mock_save:
+            self.tutor.save_progress()
+            mock_save.assert_called_once_with(self.tutor.progress)
+
+
+class TestNoOpSaves(TempTutorMixin, unittest.TestCase):
+    """Test LinuxTutor skips saves when nothing changed."""
+
+    def test_setting_same_level_does_not_save(self):
+        """Test re-setting the current level skips the write."""
+        with patch.object(self.tutor.progress_mgr, 'save_progress') as mock_save, \
+                patch('sys.stdout', new_callable=StringIO):
+            self.tutor.set_level(self.tutor.progress['current_level'])
+            mock_save.assert_not_called()
+
+            self.tutor.set_level('expert')
+            mock_save.assert_called_once()
+
+    def test_recompleting_lesson_does_not_save(self):
+        """Test completing an already-completed lesson skips the write."""
+        with patch.object(self.tutor.progress_mgr, 'save_progress') as mock_save, \
+                patch('sys.stdout', new_callable=StringIO):
+            self.tutor.complete_lesson('intro-to-terminal')
+            self.tutor.complete_lesson('intro-to-terminal')
+            mock_save.assert_called_once()
+
+        self.assertEqual(self.tutor.progress['stats']['lessons_completed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
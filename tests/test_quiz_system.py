@@ -116,6 +116,14 @@ class TestMultipleChoiceQuestion(unittest.TestCase):
         self.assertEqual(self.question.correct_index, 0)
         self.assertEqual(self.question.options[0], 'Print Working Directory')
 
+    def test_render_letters_options(self):
+        """Test rendered question lists options with letters."""
+        self.assertEqual(
+            self.question.render(),
+            "What does pwd do?\n\n"
+            "A) Print Working Directory\nB) Power Directory\nC) Present Data\nD) Process Dir"
+        )
+
     def test_missing_options_key(self):
         """Test raises error when options key is missing."""
         data = {
@@ -2,6 +2,7 @@
 
 import unittest
 import sys
+from contextlib import contextmanager, redirect_stdout
 from io import StringIO
 from pathlib import Path
 
@@ -18,6 +19,14 @@ from lessons import (
 from linuxtutor import LinuxTutor
 
 
+@contextmanager
+def capture_stdout():
+    """Capture stdout into a StringIO, restoring it even if the body raises."""
+    buffer = StringIO()
+    with redirect_stdout(buffer):
+        yield buffer
+
+
 class TestExtractSnippet(unittest.TestCase):
     """Test the _extract_snippet helper function."""
 
@@ -207,6 +216,11 @@ class TestSearchInLesson(unittest.TestCase):
         result = _search_in_lesson(self.lesson, ['nonexistent'])
         self.assertIsNone(result)
 
+    def test_empty_keywords_do_not_match(self):
+        """Test empty keywords are dropped rather than matching everything."""
+        self.assertIsNone(_search_in_lesson(self.lesson, ['']))
+        self.assertIsNone(_search_in_lesson(self.lesson, []))
+
 
 class TestSearchLessons(unittest.TestCase):
     """Test the search_lessons public API function."""
@@ -265,6 +279,31 @@ class TestSearchLessons(unittest.TestCase):
         advanced_results = [r for r in results if r['lesson_data']['level'] == 'advanced']
         self.assertGreater(len(advanced_results), 0)
 
+    def test_level_filter_matches_post_filtering(self):
+        """Test searching one level returns the same ranked results as filtering afterwards."""
+        for level in ['beginner', 'intermediate', 'advanced', 'expert']:
+            with self.subTest(level=level):
+                expected = [r['lesson_id'] for r in search_lessons(['file'])
+                            if r['lesson_data']['level'] == level]
+                filtered = [r['lesson_id'] for r in search_lessons(['file'], level)]
+                self.assertEqual(filtered, expected)
+
+    def test_modifying_results_does_not_affect_later_searches(self):
+        """Test a repeated (memoized) search is unaffected by changes to earlier results."""
+        first = search_lessons(['file'])
+        expected = [(r['score'], set(r['fields_matched']), dict(r['snippets'])) for r in first]
+        for result in first:
+            result['score'] = 0
+            result['fields_matched'].add('bogus')
+            result['snippets']['bogus'] = 'changed'
+        first.clear()
+
+        again = search_lessons(['file'])
+        self.assertEqual(
+            [(r['score'], r['fields_matched'], r['snippets']) for r in again],
+            expected
+        )
+
 
 class TestRelevanceScoring(unittest.TestCase):
     """Test relevance scoring and ranking."""
@@ -291,9 +330,10 @@ class TestRelevanceScoring(unittest.TestCase):
 class TestLinuxTutorSearchMethod(unittest.TestCase):
     """Test the LinuxTutor.search_lessons method."""
 
-    def setUp(self):
-        """Set up LinuxTutor instance for testing."""
-        self.tutor = LinuxTutor()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one LinuxTutor instance shared by the read-only search tests."""
+        cls.tutor = LinuxTutor()
 
     def test_search_lessons_method_exists(self):
         """Test that search_lessons method exists."""
@@ -301,14 +341,10 @@ class TestLinuxTutorSearchMethod(unittest.TestCase):
 
     def test_search_with_keywords(self):
         """Test search with valid keywords."""
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
+        with capture_stdout() as out:
+            self.tutor.search_lessons(['file'])
 
-        self.tutor.search_lessons(['file'])
-
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        output = out.getvalue()
 
         # Should have output
         self.assertGreater(len(output), 0)
@@ -316,13 +352,10 @@ class TestLinuxTutorSearchMethod(unittest.TestCase):
 
     def test_search_with_level_filter(self):
         """Test search with level filter."""
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        self.tutor.search_lessons(['linux'], level_filter='beginner')
+        with capture_stdout() as out:
+            self.tutor.search_lessons(['linux'], level_filter='beginner')
 
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        output = out.getvalue()
 
         # Should filter to beginner level
         if 'Found' in output:
@@ -330,25 +363,19 @@ class TestLinuxTutorSearchMethod(unittest.TestCase):
 
     def test_search_no_results(self):
         """Test search with no results."""
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        self.tutor.search_lessons(['xyznonexistent'])
+        with capture_stdout() as out:
+            self.tutor.search_lessons(['xyznonexistent'])
 
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        output = out.getvalue()
 
         self.assertIn('No lessons found', output)
 
     def test_search_empty_keywords(self):
         """Test search with empty keyword list."""
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
+        with capture_stdout() as out:
+            self.tutor.search_lessons([])
 
-        self.tutor.search_lessons([])
-
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        output = out.getvalue()
 
         self.assertIn('Error', output)
 
@@ -374,6 +401,15 @@ class TestEdgeCases(unittest.TestCase):
         # Should handle gracefully
         self.assertIsInstance(results, list)
 
+    def test_repeated_and_empty_keywords_ignored(self):
+        """Test repeated or empty keywords search like the distinct keywords alone."""
+        expected = [(r['lesson_id'], r['score']) for r in search_lessons(['file'])]
+        for keywords in (['file', 'FILE'], ['', 'file'], ['file', 'file', '']):
+            with self.subTest(keywords=keywords):
+                results = search_lessons(keywords)
+                self.assertEqual([(r['lesson_id'], r['score']) for r in results], expected)
+        self.assertEqual(search_lessons(['']), [])
+
     def test_single_character_keyword(self):
         """Test search with single character."""
         results = search_lessons(['a'])
@@ -409,11 +445,13 @@ class TestIntegration(unittest.TestCase):
             self.assertIn('snippets', result)
 
     def test_search_performance_acceptable(self):
-        """Test that search completes in reasonable time."""
+        """Test that an uncached search completes in reasonable time."""
         import time
-        start = time.time()
-        search_lessons(['test'])
-        elapsed = time.time() - start
+        # Scan every lesson directly so the memoized search cannot answer from cache
+        start = time.perf_counter()
+        for lesson_data in LESSONS.values():
+            _search_in_lesson(lesson_data, ['test'])
+        elapsed = time.perf_counter() - start
         # Should complete in less than 1 second
         self.assertLess(elapsed, 1.0)
 
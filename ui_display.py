@@ -1,5 +1,6 @@
 """User interface display functions - all print statements."""
 
+from functools import lru_cache
 from typing import List, Optional, Set
 from constants import (
     SEPARATOR_LIGHT, SEPARATOR_MEDIUM, SEPARATOR_HEAVY,
@@ -7,48 +8,69 @@ from constants import (
 )
 
 
+@lru_cache(maxsize=256)
+def lesson_display_name(lesson_id: str) -> str:
+    """Format a lesson ID for display, e.g. 'intro-to-terminal' -> 'Intro To Terminal'."""
+    return lesson_id.replace('-', ' ').title()
+
+
 def display_welcome_message(first_time: bool, config_dir: str) -> None:
     """Display welcome message for first-time or returning users."""
     if first_time:
-        print("Welcome to LinuxTutor!")
-        print(SEPARATOR_MEDIUM)
-        print("\nYou're about to start your Linux learning journey!")
-        print("LinuxTutor will guide you from complete beginner to Linux expert.")
-        print("\nHere's how it works:")
-        print("- Progressive lessons from beginner to expert level")
-        print("- Hands-on exercises with real commands")
-        print("- Your progress is automatically saved")
-        print("- Safe practice environment")
-        print(f"\nYour progress will be saved in: {config_dir}")
+        lines = [
+            "Welcome to LinuxTutor!",
+            SEPARATOR_MEDIUM,
+            "\nYou're about to start your Linux learning journey!",
+            "LinuxTutor will guide you from complete beginner to Linux expert.",
+            "\nHere's how it works:",
+            "- Progressive lessons from beginner to expert level",
+            "- Hands-on exercises with real commands",
+            "- Your progress is automatically saved",
+            "- Safe practice environment",
+            f"\nYour progress will be saved in: {config_dir}",
+        ]
     else:
-        print("Welcome back to LinuxTutor!")
-        print(SEPARATOR_LIGHT)
+        lines = ["Welcome back to LinuxTutor!", SEPARATOR_LIGHT]
+    print('\n'.join(lines))
+
+
+def display_welcome_banner(first_time: bool) -> None:
+    """Display the short banner shown when linuxtutor is run without a command."""
+    if first_time:
+        print("Welcome to LinuxTutor!\nTo get started, run: linuxtutor start")
+    else:
+        print("LinuxTutor - Interactive Linux Learning\n"
+              "Run 'linuxtutor start' to continue learning or 'linuxtutor help' for options.")
 
 
 def display_lesson_list(lesson_ids: List[str], level: str, completed_lessons: Set[str]) -> None:
     """Display a formatted list of lessons."""
-    print(f"\n{level.title()} Level Lessons:")
+    lines = [f"\n{level.title()} Level Lessons:"]
     for i, lesson_id in enumerate(lesson_ids, 1):
         status = CHECKBOX_COMPLETED if lesson_id in completed_lessons else CHECKBOX_PENDING
-        title = lesson_id.replace('-', ' ').title()
-        print(f"  {status} {i}. {title}")
+        title = lesson_display_name(lesson_id)
+        lines.append(f"  {status} {i}. {title}")
+    print('\n'.join(lines))
 
 
 def display_lesson_header(title: str, level: str, duration: int, description: str) -> None:
     """Display lesson header information."""
-    print(f"\n=== {title} ===")
-    print(f"Level: {level.title()}")
-    print(f"Duration: ~{duration} minutes\n")
-    print(description)
+    print(f"\n=== {title} ===\n"
+          f"Level: {level.title()}\n"
+          f"Duration: ~{duration} minutes\n\n"
+          f"{description}")
 
 
 def display_prerequisites_error(lesson_name: str, missing_prereqs: List[str]) -> None:
     """Display error message for missing prerequisites."""
-    print(f"\nWARNING: Cannot start '{lesson_name}' yet.")
-    print("You need to complete these lessons first:")
+    lines = [
+        f"\nWARNING: Cannot start '{lesson_name}' yet.",
+        "You need to complete these lessons first:",
+    ]
     for prereq in missing_prereqs:
-        print(f"  - {prereq.replace('-', ' ').title()}")
-    print(f"\nStart with: linuxtutor lesson {missing_prereqs[0]}")
+        lines.append(f"  - {lesson_display_name(prereq)}")
+    lines.append(f"\nStart with: linuxtutor lesson {missing_prereqs[0]}")
+    print('\n'.join(lines))
 
 
 def display_lesson_not_found(lesson_name: str) -> None:
@@ -67,24 +89,22 @@ def display_lesson_suggestions(similar_lessons: List[str]) -> None:
 
 def display_search_results(results: List[dict], keywords: List[str]) -> None:
     """Display search results with lesson details."""
-    from lessons import LESSONS
-
     if not results:
         print(f"\nNo lessons found matching: {', '.join(keywords)}")
         return
 
     plural = 's' if len(results) != 1 else ''
-    print(f"\nFound {len(results)} lesson{plural} matching: {', '.join(keywords)}\n")
+    lines = [f"\nFound {len(results)} lesson{plural} matching: {', '.join(keywords)}\n"]
 
     for i, result in enumerate(results, 1):
         lesson = result['lesson_data']
-        print(f"{i}. [{lesson['level'].title()}] {lesson['title']} (Score: {result['score']})")
-        print(f"   Duration: {lesson['duration']} minutes")
+        lines.append(f"{i}. [{lesson['level'].title()}] {lesson['title']} (Score: {result['score']})")
+        lines.append(f"   Duration: {lesson['duration']} minutes")
 
+    print('\n'.join(lines))
 
-def display_help_text() -> None:
-    """Display help information."""
-    help_text = """
+
+_HELP_TEXT = """
 LinuxTutor - Interactive Linux Learning CLI
 
 Commands:
@@ -106,61 +126,78 @@ Examples:
 Skill Levels:
   beginner, intermediate, advanced, expert
 """
-    print(help_text)
+
+
+def display_help_text() -> None:
+    """Display help information."""
+    print(_HELP_TEXT)
 
 
 def display_status(progress: dict) -> None:
     """Display user's current progress and statistics."""
-    print("\nYour Progress")
-    print(SEPARATOR_LIGHT)
-    print(f"Current Level: {progress['current_level'].title()}")
-    print(f"Lessons Completed: {progress['stats']['lessons_completed']}")
-    print(f"Exercises Completed: {progress['stats']['exercises_completed']}")
+    lines = [
+        "\nYour Progress",
+        SEPARATOR_LIGHT,
+        f"Current Level: {progress['current_level'].title()}",
+        f"Lessons Completed: {progress['stats']['lessons_completed']}",
+        f"Exercises Completed: {progress['stats']['exercises_completed']}",
+    ]
 
     if progress.get('current_lesson'):
-        print(f"Current Lesson: {progress['current_lesson'].replace('-', ' ').title()}")
+        lines.append(f"Current Lesson: {lesson_display_name(progress['current_lesson'])}")
 
     if progress['completed_lessons']:
-        print("\nCompleted Lessons:")
+        lines.append("\nCompleted Lessons:")
         for lesson in progress['completed_lessons']:
-            print(f"  {CHECKBOX_COMPLETED} {lesson.replace('-', ' ').title()}")
+            lines.append(f"  {CHECKBOX_COMPLETED} {lesson_display_name(lesson)}")
+
+    print('\n'.join(lines))
 
 
 def display_post_lesson_menu(has_next_lesson: bool, next_lesson_title: Optional[str] = None) -> None:
     """Display the post-lesson action menu."""
-    print("\n" + SEPARATOR_MEDIUM)
-    print("What would you like to do next?")
-    print(SEPARATOR_MEDIUM)
+    lines = ["\n" + SEPARATOR_MEDIUM, "What would you like to do next?", SEPARATOR_MEDIUM]
 
     if has_next_lesson and next_lesson_title:
-        print(f"\n1. Continue to next lesson: {next_lesson_title}")
-        print("2. Choose a different lesson")
-        print("3. View your progress")
-        print("4. Exit")
+        lines += [
+            f"\n1. Continue to next lesson: {next_lesson_title}",
+            "2. Choose a different lesson",
+            "3. View your progress",
+            "4. Exit",
+        ]
     else:
-        print("\n1. Level up to next difficulty")
-        print("2. View your progress")
-        print("3. Exit")
+        lines += [
+            "\n1. Level up to next difficulty",
+            "2. View your progress",
+            "3. Exit",
+        ]
+
+    print('\n'.join(lines))
 
 
 def display_no_lessons_available(blocked_lessons: List[tuple], current_level: str) -> None:
     """Display message when no lessons are available due to unmet prerequisites."""
-    print("\nNo lessons available at your current level yet.")
-    print("You need to complete prerequisite lessons first.")
-    print()
+    lines = [
+        "\nNo lessons available at your current level yet.",
+        "You need to complete prerequisite lessons first.",
+        "",
+    ]
 
     if blocked_lessons:
-        print("Lessons blocked by prerequisites:")
+        lines.append("Lessons blocked by prerequisites:")
         for lesson_title, missing_prereqs in blocked_lessons[:3]:
-            print(f"  - {lesson_title}")
-            prereq_titles = [p.replace('-', ' ').title() for p in missing_prereqs]
-            print(f"    Need: {', '.join(prereq_titles)}")
-
-    print()
-    print("Recommendations:")
-    print("1. Go back and complete beginner lessons")
-    print(f"2. Run 'linuxtutor lessons beginner' to see available lessons")
-    print("3. Run 'linuxtutor status' to check your progress")
+            lines.append(f"  - {lesson_title}")
+            prereq_titles = [lesson_display_name(p) for p in missing_prereqs]
+            lines.append(f"    Need: {', '.join(prereq_titles)}")
+
+    lines += [
+        "",
+        "Recommendations:",
+        "1. Go back and complete beginner lessons",
+        "2. Run 'linuxtutor lessons beginner' to see available lessons",
+        "3. Run 'linuxtutor status' to check your progress",
+    ]
+    print('\n'.join(lines))
 
 
 def display_level_up_prompt(next_level: str) -> None:
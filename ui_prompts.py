@@ -3,31 +3,52 @@
 from constants import AFFIRMATIVE_RESPONSES
 
 
+def _read_input(message: str, on_eof: str) -> str:
+    """
+    Read a line of user input, tolerating closed stdin.
+
+    Args:
+        message: The prompt message to display
+        on_eof: Value returned when stdin is exhausted (e.g. redirected from /dev/null)
+
+    Returns:
+        The line entered by the user, or on_eof
+    """
+    try:
+        return input(message)
+    except EOFError:
+        print()
+        return on_eof
+
+
 def prompt_yes_no(message: str) -> bool:
     """
     Prompt user with a yes/no question.
 
+    End of input counts as "no", since nothing that follows could be answered.
+
     Args:
         message: The prompt message to display
 
     Returns:
         True if user answered affirmatively, False otherwise
     """
-    response = input(message).lower().strip()
+    response = _read_input(message, 'n').strip().lower()
     return response in AFFIRMATIVE_RESPONSES
 
 
-def prompt_choice(message: str) -> str:
+def prompt_choice(message: str, on_eof: str = '') -> str:
     """
     Prompt user for a choice.
 
     Args:
         message: The prompt message to display
+        on_eof: Choice to assume when stdin is exhausted
 
     Returns:
         User's choice as a string
     """
-    return input(message).strip()
+    return _read_input(message, on_eof).strip()
 
 
 def prompt_lesson_selection() -> str:
@@ -35,9 +56,9 @@ def prompt_lesson_selection() -> str:
     Prompt user to select a lesson.
 
     Returns:
-        Selected lesson name
+        Selected lesson name ('exit' when stdin is exhausted)
     """
-    return input("\nEnter lesson name (or 'exit' to quit): ").strip()
+    return _read_input("\nEnter lesson name (or 'exit' to quit): ", 'exit').strip()
 
 
 def prompt_press_enter(message: str = "\nPress Enter to continue...") -> None:
@@ -47,4 +68,4 @@ def prompt_press_enter(message: str = "\nPress Enter to continue...") -> None:
     Args:
         message: Optional custom message
     """
-    input(message)
+    _read_input(message, '')